@@ -6,16 +6,18 @@
 #
 # Version: 20220801175222
 
+import os
 import signal
 import sys
 import threading
-from datetime import datetime
-from queue import Queue
+from collections import deque
+from functools import partial
+from io import UnsupportedOperation
 from time import sleep
 
 import serial
 
-from .Message import CaptureTimeStamp, Message
+from .Message import Message
 
 
 class Interface:
@@ -51,9 +53,6 @@ class Interface:
         self.fast = fast
         self.dummy = dummy
 
-        signal.signal(signal.SIGTERM, self._on_interrupt)
-        signal.signal(signal.SIGINT, self._on_interrupt)
-
         self.exit = False
         self.capture_finished = False
 
@@ -64,16 +63,23 @@ class Interface:
 
         self.receiver_handler = []
 
-        self.rd_event = threading.Event()
+        # deque.append() and deque.popleft() are atomic, the semaphores count the queued messages and the free space.
+        # the queue is bounded so a slow handler or a long replay cannot make it grow without limit.
+        # a long replay waits for space, while serial input drops messages rather than stop reading the port.
+        self.inputqueue: deque = deque()
+        self.inputsignal = threading.Semaphore(0)
+        self.inputspace = threading.Semaphore(1024)
 
-        self.inputqueue: Queue = Queue()
+        # bytes received from the serial interface or capture file that do not form a complete message yet
+        self.rxbuf = bytearray()
 
         self.outputThread = threading.Thread(name="sender", target=self._sender_thread)
         self.outputThread.setDaemon(True)
-        self.outputqueue: Queue = Queue()
+        self.outputqueue: deque = deque()
+        self.outputsignal = threading.Semaphore(0)
 
         self.input = "com"
-        if type(port) == str:
+        if isinstance(port, str):
             if not dummy:
                 try:
                     # 8 bits, 1 stop bit, 1 start bit
@@ -82,34 +88,52 @@ class Interface:
                         baudrate=baud,
                         stopbits=serial.STOPBITS_ONE,
                         bytesize=serial.EIGHTBITS,
-                        timeout=None,
+                        timeout=0.5,  # a blocking read returns regularly so we can check self.exit
                     )
                 except serial.SerialException as e:
                     exit(e)
+                # on Linux, ask the driver to pass on received bytes immediately instead of buffering them (FTDI waits 16ms by default)
+                # other platforms either lack the method or raise NotImplementedError
+                if sys.platform.startswith("linux"):
+                    try:
+                        self.com.set_low_latency_mode(True)
+                    except ValueError:
+                        pass  # not supported by this driver, not a problem
         else:
             self.input = "file"
             self.com = port
 
+        # only now, because the handler needs self.input and self.com
+        signal.signal(signal.SIGTERM, self._on_interrupt)
+        signal.signal(signal.SIGINT, self._on_interrupt)
+
     def _on_interrupt(self, signum, frame):
         """
         Signal handler, sets self.exit to True.
 
+        Any blocking read or write on the serial interface is cancelled so the threads can exit right away.
+
         Args:
             signum: not used
             frame : not used
         """
         self.exit = True
+        if self.input == "com" and not self.dummy:
+            self.com.cancel_read()
+            self.com.cancel_write()
 
     def _on_receive(self, msg):
         """
         Dispatch a message object to registered handlers.
 
+        Message objects are never recycled, so handlers are free to keep a reference to them.
+        Handlers should not modify them though: received PowerOn and PowerOff messages are shared instances.
+
         Args:
             msg (Message): A LocoNet [Message](pylnlib.Message.md)
         """
-        if self.receiver_handler != None:
-            for handler in self.receiver_handler:
-                handler(msg)
+        for handler in self.receiver_handler:
+            handler(msg)
 
     def _processTimeStamp(self, msg):
         """
@@ -146,20 +170,31 @@ class Interface:
         self.inputThread.start()
         self.outputThread.start()
 
+        acquire = self.inputsignal.acquire
+        popleft = self.inputqueue.popleft
+        release = self.inputspace.release
+
         # main loop that pulls messages from msg_queue
         while not self.exit:
-            if self.rd_event.wait(1):
-                self.rd_event.clear()
-
-                while not self.inputqueue.empty():
-                    if delay > 0:
-                        sleep(delay)
-                    msg = self.inputqueue.get()
-                    if isinstance(msg, CaptureTimeStamp):
-                        self._processTimeStamp(msg)
-                    else:
-                        self._on_receive(msg)
+            if not acquire(timeout=1):
+                continue
+            # take everything that is queued right now, so the producers can carry on while we dispatch
+            batch = [popleft()]
+            release()
+            while acquire(blocking=False):
+                batch.append(popleft())
+                release()
+            for msg in batch:
+                if delay > 0:
+                    sleep(delay)
+                if msg.is_timestamp:
+                    self._processTimeStamp(msg)
+                else:
+                    self._on_receive(msg)
 
+        # wake up the sender thread so it can exit right away
+        self.outputqueue.append(None)
+        self.outputsignal.release()
         self.inputThread.join()
         self.outputThread.join()
 
@@ -188,56 +223,117 @@ class Interface:
         """
         Read data from the interface and fill the internal input queue with messages.
         """
+        if self.dummy:
+            return  # there is nothing to read, so no need to keep waking up
+        if self.input == "com":
+            self._read_serial()
+        else:
+            self._read_capture()
+
+    def _read_serial(self):
+        """
+        Read data from the serial interface until we are asked to exit.
+        """
+        com = self.com
+        read = com.read
+        rxbuf = self.rxbuf
+        queueFrames = self._queueFrames
         while not self.exit:
-            if self.dummy:
-                sleep(0.1)
-            elif self.input == "com":
-                n = self.com.inWaiting()
-                if n > 1:  # all messages are at least 2 bytes
-                    data = self.com.read(2)
-                    length = Message.length(data[0], data[1])
-                    if length == 2:
-                        msg = Message.from_data(data)
-                    else:
-                        data2 = self.com.read(
-                            length - 2
-                        )  # this is blocking, might want to change that
-                        msg = Message.from_data(data + data2)
-                    self.inputqueue.put(msg)
-                    self.rd_event.set()
-                else:
-                    sleep(0.1)
-            elif not self.capture_finished:
-                data = self.com.read(2)
-                if len(data) == 0:
-                    self.capture_finished = True
-                elif len(data) < 2:
+            # blocks until data arrives (or the read times out) and picks up everything else that is waiting
+            try:
+                rxbuf += read(max(com.in_waiting, 1))
+            except OSError as e:  # also covers serial.SerialException
+                # e.g. the adapter was unplugged (in_waiting then raises a plain OSError),
+                # nothing will arrive anymore so shut down instead of waiting forever
+                print(e, file=sys.stderr)
+                self.exit = True
+                break
+            queueFrames()
+
+    def _read_capture(self):
+        """
+        Read data from a capture file until it is exhausted or we are asked to exit.
+
+        Raises:
+            IOError: if the capture file ends in the middle of a message.
+        """
+        try:
+            # read straight from the file descriptor in large blocks, bypassing the buffered file object
+            read = partial(os.read, self.com.fileno())
+        except (AttributeError, UnsupportedOperation):
+            # not a real file, e.g. an io.BytesIO
+            read = self.com.read
+        rxbuf = self.rxbuf
+        queueFrames = self._queueFrames
+        while not self.exit:
+            data = read(65536)
+            if len(data) == 0:
+                self.capture_finished = True
+                if len(rxbuf):
                     raise IOError("captured stream ended prematurely")
-                else:
-                    length = Message.length(data[0], data[1])
-                    if length == 2:
-                        msg = Message.from_data(data)
-                    else:
-                        data2 = self.com.read(length - 2)
-                        if len(data2) < length - 2:
-                            raise IOError("captured stream ended prematurely")
-                        msg = Message.from_data(data + data2)
-                    self.inputqueue.put(msg)
-                    self.rd_event.set()
+                break  # nothing more will arrive
+            rxbuf += data
+            queueFrames()
+
+    def _queueFrames(self):
+        """
+        Convert all complete frames in the receive buffer to messages and put them on the internal input queue.
+
+        Any incomplete frame is left in the buffer until more data arrives.
+        """
+        # local names for everything used per message
+        rxbuf = self.rxbuf
+        lengths = Message.LENGTHS
+        from_data = Message.from_data
+        append = self.inputqueue.append
+        release = self.inputsignal.release
+        acquire = self.inputspace.acquire
+        # a capture file can simply wait for the consumer, but a serial port must be read on time or the driver drops bytes
+        drop = self.input == "com"
+        timeout = 1
+        start = 0
+        end = len(rxbuf)
+        # slicing the view copies each frame just once, the consumed bytes are removed in one go afterwards
+        with memoryview(rxbuf) as view:
+            while end - start >= 2:  # all messages are at least 2 bytes
+                length = lengths[rxbuf[start]] or rxbuf[start + 1]
+                if end - start < length:
+                    break
+                msg = from_data(view[start : start + length].tobytes())
+                start += length
+                if not acquire(timeout=timeout):  # the queue is full
+                    if drop:
+                        # losing a whole message is better than losing bytes and getting out of step with the frames
+                        print("input queue full, dropped", msg, file=sys.stderr)
+                        timeout = 0  # and don't wait again for the rest of what we have buffered
+                        continue
+                    while not acquire(timeout=1):
+                        if self.exit:
+                            return
+                append(msg)
+                release()
+        del rxbuf[:start]
 
     def _sender_thread(self):
         """
         Retrieve messages in the internal output queue and send them to the serial interface.
         """
+        acquire = self.outputsignal.acquire
+        popleft = self.outputqueue.popleft
         while not self.exit:
-            if not self.outputqueue.empty():
-                msg = self.outputqueue.get()
-                if self.input == "com" and not self.dummy:
-                    self.com.write(msg.data)
-                else:  # on replay or dummy output we simply shunt back the output message
-                    self.inputqueue.put(msg)
-                    self.rd_event.set()
-                sleep(0.25)
+            if not acquire(timeout=1):
+                continue
+            msg = popleft()
+            if msg is None:
+                break
+            if self.input == "com" and not self.dummy:
+                self.com.write(msg.data)
+            else:  # on replay or dummy output we simply shunt back the output message
+                while not self.inputspace.acquire(timeout=1):
+                    if self.exit:
+                        return
+                self.inputqueue.append(msg)
+                self.inputsignal.release()
 
     def sendMessage(self, msg):
         """
@@ -246,7 +342,8 @@ class Interface:
         Args:
             msg (Message): A LocoNet [Message](pylnlib.Message.md)
         """
-        self.outputqueue.put(msg)
+        self.outputqueue.append(msg)
+        self.outputsignal.release()
 
 
 def timeDiff(a, b):
@@ -262,10 +359,12 @@ def timeDiff(a, b):
     Returns:
         (float) : the total number of seconds between  a and b
     """
-    T = datetime.today()
-    A = datetime.combine(T, a)
-    B = datetime.combine(T, b)
-    s = (B - A).total_seconds()
+    s = (
+        (b.hour - a.hour) * 3600
+        + (b.minute - a.minute) * 60
+        + (b.second - a.second)
+        + (b.microsecond - a.microsecond) / 1e6
+    )
     if s < 0:
         s = 24 * 3600 + s
     return s
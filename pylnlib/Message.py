@@ -12,6 +12,12 @@
 # See also: https://wiki.rocrail.net/doku.php?id=loconet:ln-pe-en
 
 from datetime import time
+from functools import reduce
+from operator import xor
+from struct import Struct
+
+# the first 13 bytes of a slot data message (everything but the checksum), without the copy a slice would make
+_unpack13 = Struct("13B").unpack_from
 
 
 class Message:
@@ -57,15 +63,23 @@ class Message:
     OPC_SL_RD_DATA = 0xE7
     OPC_WR_SL_DATA = 0xEF
 
+    # message length for every possible opcode, determined by bits 6 and 5. 0 means the length is in the next byte.
+    LENGTHS = bytes((2, 4, 6, 0)[(opcode >> 5) & 3] for opcode in range(256))
+
+    # only True for CaptureTimeStamp, cheaper to check than isinstance() for every received message
+    is_timestamp = False
+
     def __init__(self, data):
         self.opcode = data[0]
-        self.length = Message.length(data[0], data[1])
+        self.length = Message.LENGTHS[data[0]] or data[1]
         self.data = data
         self.checksum = data[-1]
         if len(data) != self.length:
             raise ValueError("length mismatch")
-        calculated_checksum = Message.checksum(data[:-1])
-        if self.checksum and self.checksum != calculated_checksum:
+        # with a correct checksum the xor over all bytes is 0xFF for an even length and 0 for an odd length,
+        # so we can check the data as is, without slicing off the checksum byte
+        if self.checksum and reduce(xor, data, 0) != (0 if self.length & 1 else 0xFF):
+            calculated_checksum = Message.checksum(data[:-1])
             raise ValueError(
                 f"checksum error {self.checksum:x} != {calculated_checksum=:x}"
             )
@@ -77,16 +91,21 @@ class Message:
         Returns:
             list[str] :  a list of lowercase hexadecimal number with leading zeros.
         """
-        return list(f"{v:02x}" for v in map(int, self.data))
+        # bytes.hex() formats all bytes in a single call
+        return bytes(self.data).hex(" ").split(" ")
 
     def __str__(self):
-        return f"{self.__class__.__name__}(opcode={hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+        return f"{self.__class__.__name__}(opcode={hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
 
     def updateChecksum(self):
         """
         Calculate the checksum of the data and store it in the last byte.
         """
-        self.checksum = self.data[-1] = Message.checksum(self.data[:-1])
+        data = self.data
+        # starting the xor with the current last byte cancels it out, so we don't need a slice without it
+        self.checksum = data[-1] = reduce(xor, data, data[-1]) ^ (
+            0 if len(data) & 1 else 0xFF
+        )
 
     @staticmethod
     def length(opcode, nextbyte):
@@ -100,18 +119,9 @@ class Message:
             nextbyte (byte): the total number of bytes in the message if the opcode indicates this is a variable length message.
 
         Returns:
-            _type_: _description_
-
+            int: the length of the message in bytes
         """
-        d6d5 = (opcode >> 5) & 3
-        if d6d5 == 0:
-            return 2
-        elif d6d5 == 1:
-            return 4
-        elif d6d5 == 2:
-            return 6
-        else:
-            return int(nextbyte)
+        return Message.LENGTHS[opcode] or int(nextbyte)
 
     @staticmethod
     def from_data(data):
@@ -127,44 +137,7 @@ class Message:
         !!! todo
             not all possible opcodes/message types are implemented yet.
         """
-        opcode = data[0]
-        if opcode == 0x83:
-            return PowerOn(data)
-        elif opcode == 0x82:
-            return PowerOff(data)
-        elif opcode == Message.OPC_LOCO_SPD:
-            return SlotSpeed(data)
-        elif opcode == Message.OPC_LOCO_DIRF:
-            return FunctionGroup1(data)
-        elif opcode == Message.OPC_LOCO_SND:
-            return FunctionGroupSound(data)
-        elif opcode == Message.OPC_LOCO_F2:
-            return FunctionGroup2(data)
-        elif opcode == 0xD4:
-            return FunctionGroup3(data)
-        elif opcode == 0xB0:
-            return RequestSwitchFunction(data)
-        elif opcode == 0xB1:
-            return SwitchState(data)
-        elif opcode == 0xB2:
-            return SensorState(data)
-        elif opcode == 0xB4:
-            return LongAcknowledge(data)
-        elif opcode == 0xBA:
-            return MoveSlots(data)
-        elif opcode == 0xBB:
-            return RequestSlotData(data)
-        elif opcode == 0xBC:
-            return RequestSwitchState(data)
-        elif opcode == 0xC0:
-            return CaptureTimeStamp(data)
-        elif opcode == 0xBF:
-            return RequestLocAddress(data)
-        elif opcode == 0xE7:
-            return SlotDataReturn(data)
-        elif opcode == 0xEF:
-            return WriteSlotData(data)
-        return Unknown(data)
+        return _OPCODE_TABLE[data[0]](data)
 
     @staticmethod
     def checksum(msg):
@@ -181,10 +154,8 @@ class Message:
         Returns:
             byte : the checksum over all the bytes
         """
-        chksum = 0
-        for c in msg:
-            chksum = chksum ^ (c ^ 0xFF)
-        return chksum
+        # xor-ing every byte with 0xFF only flips the result if there is an odd number of bytes
+        return reduce(xor, msg, 0) ^ (0xFF if len(msg) & 1 else 0)
 
     @staticmethod
     def sensoraddress(d0, d1):
@@ -323,13 +294,14 @@ class FunctionGroup1(Message):
             data = bytearray(4)
             data[0] = Message.OPC_LOCO_DIRF
             data[1] = self.slot
-            data[2] = 0
-            data[2] += 0x20 if self.dir else 0
-            data[2] += 0x10 if self.f0 else 0
-            data[2] += 0x1 if self.f1 else 0
-            data[2] += 0x2 if self.f2 else 0
-            data[2] += 0x4 if self.f3 else 0
-            data[2] += 0x8 if self.f4 else 0
+            data[2] = (
+                bool(self.dir) << 5
+                | bool(self.f0) << 4
+                | bool(self.f1)
+                | bool(self.f2) << 1
+                | bool(self.f3) << 2
+                | bool(self.f4) << 3
+            )
             super().__init__(data)
             self.updateChecksum()
         else:
@@ -338,16 +310,17 @@ class FunctionGroup1(Message):
                     "slot and speed arguments cannot be combined with data argument"
                 )
             super().__init__(data)
-            self.slot = int(data[1])
-            self.dir = bool(data[2] & 0x20)
-            self.f0 = bool(data[2] & 0x10)
-            self.f1 = bool(data[2] & 0x1)
-            self.f2 = bool(data[2] & 0x2)
-            self.f3 = bool(data[2] & 0x4)
-            self.f4 = bool(data[2] & 0x8)
+            self.slot = data[1]
+            dirf = data[2]
+            self.dir = bool(dirf & 0x20)
+            self.f0 = bool(dirf & 0x10)
+            self.f1 = bool(dirf & 0x1)
+            self.f2 = bool(dirf & 0x2)
+            self.f3 = bool(dirf & 0x4)
+            self.f4 = bool(dirf & 0x8)
 
     def __str__(self):
-        return f"{self.__class__.__name__}(slot = {self.slot} dir: {self.dir} f0: {self.f0}  f1: {self.f1} f2: {self.f2} f3: {self.f3} f4: {self.f4} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+        return f"{self.__class__.__name__}(slot = {self.slot} dir: {self.dir} f0: {self.f0}  f1: {self.f1} f2: {self.f2} f3: {self.f3} f4: {self.f4} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
 
 
 class FunctionGroupSound(Message):
@@ -379,11 +352,12 @@ class FunctionGroupSound(Message):
             data = bytearray(4)
             data[0] = Message.OPC_LOCO_SND
             data[1] = self.slot
-            data[2] = 0
-            data[2] += 0x1 if self.f5 else 0
-            data[2] += 0x2 if self.f6 else 0
-            data[2] += 0x4 if self.f7 else 0
-            data[2] += 0x8 if self.f8 else 0
+            data[2] = (
+                bool(self.f5)
+                | bool(self.f6) << 1
+                | bool(self.f7) << 2
+                | bool(self.f8) << 3
+            )
             super().__init__(data)
             self.updateChecksum()
         else:
@@ -392,14 +366,15 @@ class FunctionGroupSound(Message):
                     "slot and function arguments cannot be combined with data argument"
                 )
             super().__init__(data)
-            self.slot = int(data[1])
-            self.f5 = bool(data[2] & 0x1)
-            self.f6 = bool(data[2] & 0x2)
-            self.f7 = bool(data[2] & 0x4)
-            self.f8 = bool(data[2] & 0x8)
+            self.slot = data[1]
+            snd = data[2]
+            self.f5 = bool(snd & 0x1)
+            self.f6 = bool(snd & 0x2)
+            self.f7 = bool(snd & 0x4)
+            self.f8 = bool(snd & 0x8)
 
     def __str__(self):
-        return f"{self.__class__.__name__}(slot = {self.slot} f5: {self.f5}  f6: {self.f6} f7: {self.f7} f8: {self.f8} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+        return f"{self.__class__.__name__}(slot = {self.slot} f5: {self.f5}  f6: {self.f6} f7: {self.f7} f8: {self.f8} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
 
 
 class FunctionGroup2(Message):
@@ -430,11 +405,12 @@ class FunctionGroup2(Message):
             data = bytearray(4)
             data[0] = Message.OPC_LOCO_F2
             data[1] = self.slot
-            data[2] = 0
-            data[2] += 0x1 if self.f9 else 0
-            data[2] += 0x2 if self.f10 else 0
-            data[2] += 0x4 if self.f11 else 0
-            data[2] += 0x8 if self.f12 else 0
+            data[2] = (
+                bool(self.f9)
+                | bool(self.f10) << 1
+                | bool(self.f11) << 2
+                | bool(self.f12) << 3
+            )
             super().__init__(data)
             self.updateChecksum()
         else:
@@ -443,14 +419,15 @@ class FunctionGroup2(Message):
                     "slot and function arguments cannot be combined with data argument"
                 )
             super().__init__(data)
-            self.slot = int(data[1])
-            self.f9 = bool(data[2] & 0x1)
-            self.f10 = bool(data[2] & 0x2)
-            self.f11 = bool(data[2] & 0x4)
-            self.f12 = bool(data[2] & 0x8)
+            self.slot = data[1]
+            fn = data[2]
+            self.f9 = bool(fn & 0x1)
+            self.f10 = bool(fn & 0x2)
+            self.f11 = bool(fn & 0x4)
+            self.f12 = bool(fn & 0x8)
 
     def __str__(self):
-        return f"{self.__class__.__name__}(slot = {self.slot} f9: {self.f9}  f10: {self.f10} f11: {self.f11} f12: {self.f12} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+        return f"{self.__class__.__name__}(slot = {self.slot} f9: {self.f9}  f10: {self.f10} f11: {self.f11} f12: {self.f12} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
 
 
 class FunctionGroup3(Message):
@@ -588,38 +565,39 @@ class FunctionGroup3(Message):
                 )
             super().__init__(data)
             # data[1] is always 0x20
-            self.slot = int(data[2])
+            self.slot = data[2]
             self.fiegroup = data[3]
+            fn = data[4]
             if self.fiegroup == 0x08:
-                self.f13 = bool(data[4] & 0x1)
-                self.f14 = bool(data[4] & 0x2)
-                self.f15 = bool(data[4] & 0x4)
-                self.f16 = bool(data[4] & 0x8)
-                self.f17 = bool(data[4] & 0x10)
-                self.f18 = bool(data[4] & 0x20)
-                self.f19 = bool(data[4] & 0x40)
+                self.f13 = bool(fn & 0x1)
+                self.f14 = bool(fn & 0x2)
+                self.f15 = bool(fn & 0x4)
+                self.f16 = bool(fn & 0x8)
+                self.f17 = bool(fn & 0x10)
+                self.f18 = bool(fn & 0x20)
+                self.f19 = bool(fn & 0x40)
             elif self.fiegroup == 0x09:
-                self.f21 = bool(data[4] & 0x1)
-                self.f22 = bool(data[4] & 0x2)
-                self.f23 = bool(data[4] & 0x4)
-                self.f24 = bool(data[4] & 0x8)
-                self.f25 = bool(data[4] & 0x10)
-                self.f26 = bool(data[4] & 0x20)
-                self.f27 = bool(data[4] & 0x40)
+                self.f21 = bool(fn & 0x1)
+                self.f22 = bool(fn & 0x2)
+                self.f23 = bool(fn & 0x4)
+                self.f24 = bool(fn & 0x8)
+                self.f25 = bool(fn & 0x10)
+                self.f26 = bool(fn & 0x20)
+                self.f27 = bool(fn & 0x40)
             elif self.fiegroup == 0x05:
-                self.f12 = bool(data[4] & 0x10)
-                self.f20 = bool(data[4] & 0x20)
-                self.f28 = bool(data[4] & 0x40)
+                self.f12 = bool(fn & 0x10)
+                self.f20 = bool(fn & 0x20)
+                self.f28 = bool(fn & 0x40)
 
     def __str__(self):
         if self.fiegroup == 0x05:
-            return f"{self.__class__.__name__}(slot = {self.slot} f12: {self.f12}  f20: {self.f20} f28: {self.f28} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+            return f"{self.__class__.__name__}(slot = {self.slot} f12: {self.f12}  f20: {self.f20} f28: {self.f28} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
         elif self.fiegroup == 0x08:
-            return f"{self.__class__.__name__}(slot = {self.slot} f13: {self.f13}  f14: {self.f14} f15: {self.f15} f16: {self.f16} f17: {self.f17} f18: {self.f18} f19: {self.f19} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+            return f"{self.__class__.__name__}(slot = {self.slot} f13: {self.f13}  f14: {self.f14} f15: {self.f15} f16: {self.f16} f17: {self.f17} f18: {self.f18} f19: {self.f19} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
         elif self.fiegroup == 0x09:
-            return f"{self.__class__.__name__}(slot = {self.slot} f21: {self.f21}  f22: {self.f22} f23: {self.f23} f24: {self.f24} f25: {self.f25} f26: {self.f26} f27: {self.f27} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+            return f"{self.__class__.__name__}(slot = {self.slot} f21: {self.f21}  f22: {self.f22} f23: {self.f23} f24: {self.f24} f25: {self.f25} f26: {self.f26} f27: {self.f27} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
         else:
-            return f"{self.__class__.__name__}(slot = {self.slot} fiegroup: {self.fiegroup} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex,map(int, self.data)))})"
+            return f"{self.__class__.__name__}(slot = {self.slot} fiegroup: {self.fiegroup} | op = {hex(self.opcode)}, {self.length=}, data={list(map(hex, self.data))})"
 
 
 class RequestSwitchFunction(Message):
@@ -756,7 +734,7 @@ class LongAcknowledge(Message):
     def __init__(self, data):
         super().__init__(data)
         self.opcode = data[1] | 0x80
-        self.ack1 = int(data[2])
+        self.ack1 = data[2]
 
     def __str__(self):
         return f"{self.__class__.__name__}(reply to opcode = {hex(self.opcode)}, ack1 = {self.ack1} | op = {hex(self.opcode)}, {self.length=}, data={self.hexdata()})"
@@ -773,7 +751,7 @@ class RequestSlotData(Message):
             self.updateChecksum()
         else:
             super().__init__(slot)
-            self.slot = int(slot[1])
+            self.slot = slot[1]
 
     def __str__(self):
         return f"{self.__class__.__name__}(slot = {self.slot} | op = {hex(self.opcode)}, {self.length=}, data={self.hexdata()})"
@@ -782,25 +760,28 @@ class RequestSlotData(Message):
 class SlotDataReturn(Message):
     def __init__(self, data):
         super().__init__(data)
-        # data[1] is always 0x0e
-        self.slot = int(data[2])
-        self.status = data[3]
-        self.address = Message.slotaddress(data[4], data[9])
-        self.speed = int(data[5])
-        self.dir = bool(data[6] & 0x20)
-        self.f0 = bool(data[6] & 0x10)
-        self.f1 = bool(data[6] & 0x1)
-        self.f2 = bool(data[6] & 0x2)
-        self.f3 = bool(data[6] & 0x4)
-        self.f4 = bool(data[6] & 0x8)
-        self.f5 = bool(data[10] & 0x1)
-        self.f6 = bool(data[10] & 0x2)
-        self.f7 = bool(data[10] & 0x4)
-        self.f8 = bool(data[10] & 0x8)
-        self.trk = data[7]
-        self.ss2 = data[8]
-        self.id1 = data[11]
-        self.id2 = data[12]
+        # data[1] is always 0x0e, unpacking all bytes in one go is much cheaper than indexing every byte separately
+        _, _, slot, status, adr, spd, dirf, trk, ss2, adr2, snd, id1, id2 = _unpack13(
+            data
+        )
+        self.slot = slot
+        self.status = status
+        self.address = Message.slotaddress(adr, adr2)
+        self.speed = spd
+        self.dir = bool(dirf & 0x20)
+        self.f0 = bool(dirf & 0x10)
+        self.f1 = bool(dirf & 0x1)
+        self.f2 = bool(dirf & 0x2)
+        self.f3 = bool(dirf & 0x4)
+        self.f4 = bool(dirf & 0x8)
+        self.f5 = bool(snd & 0x1)
+        self.f6 = bool(snd & 0x2)
+        self.f7 = bool(snd & 0x4)
+        self.f8 = bool(snd & 0x8)
+        self.trk = trk
+        self.ss2 = ss2
+        self.id1 = id1
+        self.id2 = id2
 
     def __str__(self):
         return f"{self.__class__.__name__}(slot={self.slot} loc={self.address} status: {self.status} dir: {self.dir} speed: {self.speed} f0: {self.f0} f1: {self.f1} f2: {self.f2} f3: {self.f3} f4: {self.f4}  f5: {self.f5} f6: {self.f6} f7: {self.f7} f8: {self.f8} trk: {self.trk} ss2: {self.ss2} id1: {self.id1} id2: {self.id2} | op = {hex(self.opcode)}, {self.length=}, data={self.hexdata()})"
@@ -811,32 +792,33 @@ class WriteSlotData(SlotDataReturn):
         if isinstance(slot, bytes) or isinstance(slot, bytearray):
             super().__init__(slot)
         else:
-            data = bytearray(14)
-            data[0] = 0xEF
-            data[1] = 0x0E
-            data[2] = slot.id
-            data[3] = slot.status
-            data[4] = slot.address & 0x7F
-            data[9] = slot.address >> 7
-            data[5] = slot.speed
-            data[6] = 0
-            data[6] += 0x20 if slot.dir else 0
-            data[6] += 0x10 if slot.f0 else 0
-            data[6] += 0x1 if slot.f1 else 0
-            data[6] += 0x2 if slot.f2 else 0
-            data[6] += 0x4 if slot.f3 else 0
-            data[6] += 0x8 if slot.f4 else 0
-            data[7] = data[8] = 0
-            data[7] += slot.trk if slot.trk else 0
-            data[8] += slot.ss2 if slot.ss2 else 0
-            data[10] = 0
-            data[10] += 0x1 if slot.f5 else 0
-            data[10] += 0x2 if slot.f6 else 0
-            data[10] += 0x4 if slot.f7 else 0
-            data[10] += 0x8 if slot.f8 else 0
-            data[11] = data[12] = 0
-            data[11] += slot.id1 if slot.id1 else 0
-            data[12] += slot.id2 if slot.id2 else 0
+            # all bytes in one go, trk, ss2, id1 and id2 may be None
+            data = bytearray(
+                (
+                    Message.OPC_WR_SL_DATA,
+                    0x0E,
+                    slot.id,
+                    slot.status,
+                    slot.address & 0x7F,
+                    slot.speed,
+                    bool(slot.dir) << 5
+                    | bool(slot.f0) << 4
+                    | bool(slot.f1)
+                    | bool(slot.f2) << 1
+                    | bool(slot.f3) << 2
+                    | bool(slot.f4) << 3,
+                    slot.trk or 0,
+                    slot.ss2 or 0,
+                    slot.address >> 7,
+                    bool(slot.f5)
+                    | bool(slot.f6) << 1
+                    | bool(slot.f7) << 2
+                    | bool(slot.f8) << 3,
+                    slot.id1 or 0,
+                    slot.id2 or 0,
+                    0,
+                )
+            )
             Message.__init__(self, data)  # cannot skip the chain with super()
             self.updateChecksum()
 
@@ -857,7 +839,7 @@ class SlotSpeed(Message):
                 raise ValueError(
                     "slot and speed arguments cannot be combined with data argument"
                 )
-            self.slot = int(data[1])
+            self.slot = data[1]
             self.speed = data[2]
             super().__init__(data)
 
@@ -898,14 +880,16 @@ class MoveSlots(Message):
             if src is not None or dst is not None:
                 raise ValueError("slot arguments cannot be combined with data argument")
             super().__init__(data)
-            self.src = int(data[1])
-            self.dst = int(data[2])
+            self.src = data[1]
+            self.dst = data[2]
 
     def __str__(self):
         return f"{self.__class__.__name__}(src = {self.src} dst = {self.dst}| op = {hex(self.opcode)}, {self.length=}, data={self.hexdata()})"
 
 
 class CaptureTimeStamp(Message):
+    is_timestamp = True
+
     def __init__(self, t):
         if isinstance(t, time):
             data = bytearray(6)
@@ -922,3 +906,44 @@ class CaptureTimeStamp(Message):
             self.time = time(
                 hour=t[1], minute=t[2], second=t[3], microsecond=t[4] * 10000
             )
+
+
+# power messages carry no payload, so every valid one is identical and a single shared instance will do
+_POWER_MESSAGES = {
+    Message.OPC_GPON: PowerOn(bytes([Message.OPC_GPON, 0x7C])),
+    Message.OPC_GPOFF: PowerOff(bytes([Message.OPC_GPOFF, 0x7D])),
+}
+
+
+def _power_message(data):
+    """
+    Return the shared PowerOn or PowerOff instance, or a new one if the data differs (and is therefore checked).
+    """
+    msg = _POWER_MESSAGES[data[0]]
+    return msg if msg.data == data else msg.__class__(data)
+
+
+# maps an opcode to the Message subclass (or factory) that represents it, see _OPCODE_TABLE below
+_OPCODE_CLASSES = {
+    Message.OPC_GPON: _power_message,
+    Message.OPC_GPOFF: _power_message,
+    Message.OPC_LOCO_SPD: SlotSpeed,
+    Message.OPC_LOCO_DIRF: FunctionGroup1,
+    Message.OPC_LOCO_SND: FunctionGroupSound,
+    Message.OPC_LOCO_F2: FunctionGroup2,
+    Message.OPC_LOCO_F3: FunctionGroup3,
+    Message.OPC_SW_REQ: RequestSwitchFunction,
+    Message.OPC_SW_REP: SwitchState,
+    Message.OPC_INPUT_REP: SensorState,
+    Message.OPC_LONG_ACK: LongAcknowledge,
+    Message.OPC_MOVE_SLOTS: MoveSlots,
+    Message.OPC_RQ_SL_DATA: RequestSlotData,
+    Message.OPC_SW_STATE: RequestSwitchState,
+    0xC0: CaptureTimeStamp,
+    Message.OPC_LOCO_ADR: RequestLocAddress,
+    Message.OPC_SL_RD_DATA: SlotDataReturn,
+    Message.OPC_WR_SL_DATA: WriteSlotData,
+}
+
+# the same mapping for every possible first byte, so from_data() needs just an index instead of a hash lookup with a default
+_OPCODE_TABLE = tuple(_OPCODE_CLASSES.get(opcode, Unknown) for opcode in range(256))
@@ -22,6 +22,7 @@ from pylnlib.Slot import Slot
 from pylnlib.Sensor import Sensor
 from pylnlib.Switch import Switch
 from pylnlib.Message import (
+    PowerOn,
     PowerOff,
     SlotDataReturn,
     SensorState,
@@ -88,6 +89,32 @@ class TestInterface:
         assert count == 2
         assert type(msg) is PowerOff
 
+    def test_queueFrames(self, interface: Interface):
+        interface.rxbuf += bytes([0x83, 0x7C, 0xB2, 0x0C, 0x50, 0x11, 0xB2])
+        interface._queueFrames()
+        assert [type(m) for m in interface.inputqueue] == [PowerOn, SensorState]
+        assert interface.rxbuf == bytes([0xB2])
+
+    def test_read_capture_BytesIO(self):
+        from io import BytesIO
+
+        interface = Interface(port=BytesIO(bytes([0x83, 0x7C, 0xB2, 0x0C, 0x50, 0x11])))
+        interface._read_capture()
+        assert interface.capture_finished
+        assert [type(m) for m in interface.inputqueue] == [PowerOn, SensorState]
+
+    def test_queueFrames_full(self, capsys):
+        interface = Interface("/dev/null", dummy=True)
+        while interface.inputspace.acquire(blocking=False):  # fill the queue
+            pass
+        interface.rxbuf += bytes([0x83, 0x7C, 0xB2, 0x0C, 0x50, 0x11, 0x82, 0x7D])
+        start = time()
+        interface._queueFrames()
+        assert time() - start < 1.5  # a serial port does not wait for space more than once
+        assert len(interface.inputqueue) == 0
+        assert interface.rxbuf == bytes()
+        assert capsys.readouterr().err.count("input queue full") == 3
+
     def test_timeDiff(self):
         from datetime import time
 
@@ -95,3 +122,6 @@ class TestInterface:
         b = time(minute=10)
         assert timeDiff(a, b) == approx(7 * 60.0)
         assert timeDiff(b, a) == approx((24 * 60 - 7) * 60.0)
+        c = time(hour=23, minute=55, second=49, microsecond=500000)
+        d = time(minute=5, second=49)
+        assert timeDiff(c, d) == approx(9 * 60 + 59.5)
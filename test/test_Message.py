@@ -46,6 +46,7 @@ class TestMessage:
 
     def test_PowerOn_from_data(self):
         assert type(Message.from_data(TestMessage.PowerOn_data)) == PowerOn
+        assert not Message.from_data(TestMessage.PowerOn_data).is_timestamp
 
     def test_PowerOn_from_init(self):
         msg = PowerOn()
@@ -56,6 +57,16 @@ class TestMessage:
     def test_PowerOff_from_data(self):
         assert type(Message.from_data(TestMessage.PowerOff_data)) == PowerOff
 
+    def test_Power_from_data_shared(self):
+        assert Message.from_data(TestMessage.PowerOn_data) is Message.from_data(
+            bytearray(TestMessage.PowerOn_data)
+        )
+        assert Message.from_data(TestMessage.PowerOff_data) is Message.from_data(
+            TestMessage.PowerOff_data
+        )
+        with pytest.raises(ValueError):
+            Message.from_data(bytes([0x83, 0x7D]))
+
     def test_PowerOff_from_init(self):
         msg = PowerOff()
         assert msg.data == TestMessage.PowerOff_data
@@ -370,6 +381,13 @@ class TestMessage:
         msg = WriteSlotData(slot)
         assert msg.data == TestMessage.WriteSlotData_data
 
+        slot = Slot(3, speed=0.5, status=1, address=300, dir=True, f0=True, f3=True)
+        slot.f6 = slot.f8 = True
+        msg = WriteSlotData(bytes(WriteSlotData(slot).data))
+        assert msg.address == 300
+        assert (msg.dir, msg.f0, msg.f1, msg.f3) == (True, True, False, True)
+        assert (msg.f5, msg.f6, msg.f7, msg.f8) == (False, True, False, True)
+
     SlotSpeed_data = bytes([0xA0, 0x03, 0x30, 0x6C])
 
     def test_SlotSpeed_from_data(self):
@@ -414,6 +432,7 @@ class TestMessage:
         assert msg.time.minute == 2
         assert msg.time.second == 3
         assert msg.time.microsecond == 4 * 10000
+        assert msg.is_timestamp
 
     def test_CaptureTimeStamp_from_init(self):
         from datetime import time
@@ -424,3 +443,43 @@ class TestMessage:
 
     def test_Unknown_from_data(self):
         assert type(Message.from_data(bytes([0xD0, 0, 0, 0, 0, 0x2F]))) == Unknown
+
+    def test_length(self):
+        assert Message.length(0x83, 0x7C) == 2
+        assert Message.length(0xB2, 0x03) == 4
+        assert Message.length(0xD4, 0x20) == 6
+        assert Message.length(0xE7, 0x0E) == 14
+        for opcode in range(0x80, 0x100):
+            d6d5 = (opcode >> 5) & 3
+            assert Message.length(opcode, 9) == (2, 4, 6, 9)[d6d5]
+
+    def test_checksum(self):
+        for data in (b"", b"\x83", TestMessage.SensorState_data, bytes(range(128))):
+            chksum = 0
+            for c in data:
+                chksum = chksum ^ (c ^ 0xFF)
+            assert Message.checksum(data) == chksum
+
+    def test_checksum_error(self):
+        with pytest.raises(ValueError):
+            Message(bytes([0x83, 0x7D]))
+        with pytest.raises(ValueError):
+            Message(bytes([0xB2, 0x03, 0x30, 0x7F]))
+        with pytest.raises(ValueError):
+            Message(bytes([0xE5, 0x05, 0x01, 0x02, 0x01]))
+        Message(
+            bytes([0xE5, 0x05, 0x01, 0x02, Message.checksum([0xE5, 0x05, 0x01, 0x02])])
+        )
+
+    def test_hexdata(self):
+        assert Message(TestMessage.PowerOn_data).hexdata() == ["83", "7c"]
+        assert Message(bytearray(TestMessage.SensorState_data)).hexdata() == [
+            f"{v:02x}" for v in TestMessage.SensorState_data
+        ]
+
+    def test_updateChecksum(self):
+        msg = SensorState(10, level=True)
+        msg.data[2] ^= 0x10  # flip the level, leaving a stale checksum
+        msg.updateChecksum()
+        assert msg.checksum == Message.checksum(msg.data[:-1])
+        assert SensorState(bytes(msg.data)).level is False